@@ -92,7 +92,6 @@ class AuthorTool(tk.Tk):
         os.makedirs(self._graph_out_dir, exist_ok=True)
         self._graph_svg_path = os.path.join(self._graph_out_dir, "graph.svg")
         self._graph_dot_path = os.path.join(self._graph_out_dir, "graph.dot")
-        self._graph_html_path = os.path.join(self._graph_out_dir, "viewer.html")
 
         self._build_menu()
         self._build_ui()
@@ -1325,12 +1324,13 @@ class AuthorTool(tk.Tk):
         export_dot(self.book, self.book_dir, self._graph_dot_path)
         subprocess.run([dot_path, "-Tsvg", self._graph_dot_path, "-o", self._graph_svg_path], check=True)
 
-    def _write_graph_viewer_html(self) -> None:
+    def _check_graph_viewer_html(self) -> None:
         """
-        Stage the HTML viewer file from <repo_root>/ui/viewer.html into the temp graph folder.
+        Make sure <repo_root>/ui/viewer.html exists before spawning the viewer.
 
-        This keeps HTML/JS out of the Python source (easier to edit and less fragile).
-        The HTML must reference the SVG as a relative file named: graph.svg
+        graph_viewer.py serves it from memory (no copy next to graph.svg); checking here
+        surfaces a missing file as a dialog instead of a silent failure in the child process.
+        The HTML must reference the SVG as a relative URL named: graph.svg
         """
         template_path = os.path.join(REPO_ROOT, "ui", "viewer.html")
         if not os.path.exists(template_path):
@@ -1340,9 +1340,6 @@ class AuthorTool(tk.Tk):
                 "Create it by copying viewer.html into <repo_root>/ui/."
             )
 
-        # Copy template into the temp output directory where graph.svg lives
-        shutil.copy2(template_path, self._graph_html_path)
-
     def _locate_graph_viewer_script(self) -> str | None:
         """
         Look for the viewer in <repo_root>/ui/graph_viewer.py (preferred),
@@ -1380,7 +1377,7 @@ class AuthorTool(tk.Tk):
         # Export once so the window opens with something visible
         try:
             self._export_graph_svg_to_temp()
-            self._write_graph_viewer_html()
+            self._check_graph_viewer_html()
         except Exception as e:
             messagebox.showerror("Graph export error", str(e))
             return
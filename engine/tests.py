@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import operator
 import random
 import re
 from dataclasses import dataclass
@@ -102,6 +104,24 @@ def roll_expr(expr: str, rng: random.Random) -> tuple[int, tuple[int, ...]]:
         return (r[0] + r[1], r)
 
 
+_SUCCESS_OPS = {
+    "roll<=stat": operator.le,
+    "roll≤stat": operator.le,
+    "roll<stat": operator.lt,
+    "roll>=stat": operator.ge,
+    "roll>stat": operator.gt,
+    "roll==stat": operator.eq,
+    "roll=stat": operator.eq,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _success_predicate(expr: str):
+    # successIf strings come from the ruleset: normalize each distinct one only once
+    e = (expr or "").strip().lower().replace(" ", "")
+    return _SUCCESS_OPS.get(e, operator.le)
+
+
 def eval_success_if(expr: str, *, roll_total: int, stat_value: int) -> bool:
     """
     Minimal safe evaluator for successIf.
@@ -109,18 +129,7 @@ def eval_success_if(expr: str, *, roll_total: int, stat_value: int) -> bool:
       roll<=stat, roll<stat, roll>=stat, roll>stat, roll==stat, roll=stat
     Fallback: roll<=stat
     """
-    e = (expr or "").strip().lower().replace(" ", "")
-    if e in ("roll<=stat", "roll≤stat"):
-        return roll_total <= stat_value
-    if e == "roll<stat":
-        return roll_total < stat_value
-    if e == "roll>=stat":
-        return roll_total >= stat_value
-    if e == "roll>stat":
-        return roll_total > stat_value
-    if e in ("roll==stat", "roll=stat"):
-        return roll_total == stat_value
-    return roll_total <= stat_value
+    return _success_predicate(expr)(roll_total, stat_value)
 
 
 def resolve_test_rule(ruleset: Optional[Ruleset], test_ref: Optional[str]) -> Optional[TestRule]:
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 import random
 import re
 import tkinter as tk
+import weakref
 from tkinter import ttk, messagebox, simpledialog, filedialog
 
 from engine.book_loader import load_book, resolve_image_path
@@ -21,7 +23,7 @@ from engine.tests import resolve_test_rule, run_test_with_roll, roll_expr as tes
 
 from ui.image_viewer import ImagePanel
 from ui.dice_widget import DiceRoller
-from ui.sfx import play_wav
+from ui.sfx import play_wav_async
 from engine.validator import validate_book
 from ui.icon import patch_toplevel_icon
 
@@ -54,12 +56,51 @@ ROLL_EXPR_RE = re.compile(r"^\s*(\d+)\s*d\s*(\d+)\s*([+-]\s*\d+)?\s*$", re.IGNOR
 # clamp these stats to [0..base_stats] via engine.rules.clamp_stats_non_negative
 CLAMP_KEYS = ("stamina", "luck")
 
+# character creation: these stats are listed first, in this order
+_PREFERRED_STATS = ("skill", "stamina", "luck")
+_PREFERRED_STATS_SET = frozenset(_PREFERRED_STATS)
+
 
 # -----------------------------
 # Dice helpers (FF style)
 # -----------------------------
 _DICE_RE = re.compile(r"^\s*(\d+)\s*d\s*(\d+)\s*$", re.IGNORECASE)
 
+# From this many dice on, sum the roll with one NumPy bulk draw (if NumPy is installed)
+_NUMPY_ROLL_MIN_DICE = 16
+_np = None  # lazily imported numpy module, False if unavailable
+# random.Random -> numpy Generator seeded from it on its first bulk roll (dies with the rng)
+_np_gens: "weakref.WeakKeyDictionary[random.Random, object]" = weakref.WeakKeyDictionary()
+
+
+def _numpy():
+    global _np
+    if _np is None:
+        try:
+            import numpy
+
+            _np = numpy
+        except Exception:
+            _np = False
+    return _np
+
+
+def _roll_dice_sum(n: int, sides: int, rng: random.Random) -> int:
+    n = max(0, n)
+    sides = max(1, sides)
+    if n >= _NUMPY_ROLL_MIN_DICE:
+        np = _numpy()
+        if np:
+            gen = _np_gens.get(rng)
+            if gen is None:
+                # Seed from rng so rolls stay reproducible for a seeded random.Random
+                gen = _np_gens[rng] = np.random.default_rng(rng.getrandbits(64))
+            return int(gen.integers(1, sides + 1, size=n).sum())
+    total = 0
+    for _ in range(n):
+        total += rng.randint(1, sides)
+    return total
+
 
 def roll_expr(expr: str, rng: random.Random) -> int:
     """
@@ -68,12 +109,7 @@ def roll_expr(expr: str, rng: random.Random) -> int:
     """
     m = _DICE_RE.match(expr or "")
     if m:
-        n = int(m.group(1))
-        sides = int(m.group(2))
-        total = 0
-        for _ in range(max(0, n)):
-            total += rng.randint(1, max(1, sides))
-        return total
+        return _roll_dice_sum(int(m.group(1)), int(m.group(2)), rng)
 
     try:
         return int(expr)
@@ -97,14 +133,54 @@ def parse_roll_expression(expr: str) -> tuple[int, int, int]:
     return n, sides, offset
 
 
+def _parse_profile_rolls(p: CharacterProfile) -> dict[str, tuple[int, int, int]]:
+    """
+    Parse a profile's roll expressions into {stat_id: (n, sides, offset)}.
+    Raises ValueError (naming the profile/stat) on an invalid expression.
+    """
+    parsed: dict[str, tuple[int, int, int]] = {}
+    for stat_id, expr in p.stat_rolls.items():
+        try:
+            parsed[stat_id] = parse_roll_expression(expr)
+        except ValueError as e:
+            raise ValueError(f"Profile '{p.profile_id}', {stat_id}: {e}") from e
+    return parsed
+
+
+def _preparse_stat_rolls(book: Book) -> dict[str, dict[str, tuple[int, int, int]]]:
+    """
+    Parse every character profile roll expression once per book load.
+    Returns {profile_id: {stat_id: (n, sides, offset)}}; raises ValueError on an invalid expression.
+    """
+    cc = getattr(book.ruleset, "character_creation", None)
+    if not cc:
+        return {}
+    return {p.profile_id: _parse_profile_rolls(p) for p in cc.profiles}
+
+
+def _append_log(txt: tk.Text, lines: list[str]) -> None:
+    """
+    Append a burst of log lines with a single insert + see("end").
+    Scrollbar updates are suspended during the insert to avoid extra redraws.
+    """
+    if not lines:
+        return
+    yscroll = txt.cget("yscrollcommand")
+    txt.configure(yscrollcommand="")
+    txt.insert("end", "\n".join(lines) + "\n")
+    txt.configure(yscrollcommand=yscroll)
+    txt.see("end")
+
+
 def _sfx_warn_if_missing(txt_widget: tk.Text) -> None:
     # Helpful debug without crashing
+    warnings: list[str] = []
     if not os.path.exists(UI_DICE_DIR):
-        txt_widget.insert("end", f"[WARN] UI dice dir not found: {UI_DICE_DIR}\n")
+        warnings.append(f"[WARN] UI dice dir not found: {UI_DICE_DIR}")
     for p in (SFX_ROLL, SFX_HIT, SFX_TIE):
         if not os.path.exists(p):
-            txt_widget.insert("end", f"[WARN] UI sound not found: {p}\n")
-    txt_widget.see("end")
+            warnings.append(f"[WARN] UI sound not found: {p}")
+    _append_log(txt_widget, warnings)
 
 
 def _ensure_books_dir_exists() -> None:
@@ -127,6 +203,18 @@ class App(tk.Tk):
 
         self.rng = random.Random()
 
+        # pid -> "[pid]\n\ntext" header, reused on repeat renders (reset when the book changes)
+        self._rendered_text_cache: dict[str, str] = {}
+        # profile_id -> {stat_id: (n, sides, offset)}, parsed once per book load
+        self._stat_roll_specs: dict[str, dict[str, tuple[int, int, int]]] = {}
+
+        # Character creation dialog, kept withdrawn between runs (see _maybe_run_character_creation)
+        self._reroll_top: tk.Toplevel | None = None
+        self._reroll_widgets: dict = {}
+
+        # Combat window widgets, built on the first fight and reused (see _run_combat)
+        self._combat_widgets: dict | None = None
+
         self._build_menu()
         self._build_layout()
 
@@ -183,6 +271,9 @@ class App(tk.Tk):
             "luck": tk.StringVar(value=""),
         }
 
+        # last "/ base" strings pushed by _sync_stats_to_ui (skip StringVar.set when unchanged)
+        self._last_base_shown: dict[str, str] = {}
+
         r = 0
         for k, var in self.stats_vars.items():
             ttk.Label(self.stats_frame, text=k.capitalize()).grid(row=r, column=0, sticky="w", padx=8, pady=6)
@@ -233,6 +324,7 @@ class App(tk.Tk):
         self.inv_frame.grid(row=0, column=2, sticky="ns", padx=8, pady=8)
 
         self.inv_list = tk.Listbox(self.inv_frame, height=25)
+        self._inv_shown: list[str] = []  # rows currently in inv_list (see _sync_inventory_to_ui)
         self.inv_list.grid(row=0, column=0, columnspan=3, padx=8, pady=8, sticky="ns")
 
         ttk.Button(self.inv_frame, text="Add", command=self.inv_add).grid(row=1, column=0, padx=8, pady=6, sticky="ew")
@@ -266,9 +358,11 @@ class App(tk.Tk):
         )
 
         self.inv_list.delete(0, "end")
+        self._inv_shown = []
         for k, var in self.stats_vars.items():
             var.set("0")
             self.stats_base_vars[k].set("")
+        self._last_base_shown.clear()
 
     # ---------- Book lifecycle ----------
 
@@ -301,12 +395,15 @@ class App(tk.Tk):
         try:
             book = load_book(xml_path)
             validate_book(book, strict=True)
+            stat_roll_specs = _preparse_stat_rolls(book)
         except Exception as e:
             messagebox.showerror("Load error", str(e))
             return
 
         self.book = book
         self.book_dir = os.path.dirname(os.path.abspath(xml_path))
+        self._rendered_text_cache.clear()
+        self._stat_roll_specs = stat_roll_specs
 
         self._init_state_for_book()
         self.rng = random.Random()
@@ -323,6 +420,7 @@ class App(tk.Tk):
         if not self.book:
             messagebox.showinfo("Restart", "No book loaded.")
             return
+        self._rendered_text_cache.clear()
         self._init_state_for_book()
         self.rng = random.Random()
 
@@ -425,8 +523,12 @@ class App(tk.Tk):
         s = data.get("state") or {}
         cur = str(s.get("current_paragraph") or self.book.start_paragraph)
 
-        stats = dict(s.get("stats") or {})
-        base_stats = dict(s.get("base_stats") or {}) or dict(stats)
+        # Normalize to int/bool once here so downstream code never re-coerces
+        raw_stats = s.get("stats") or {}
+        stats = {k: int(v) for k, v in raw_stats.items()}
+        raw_base = s.get("base_stats") or raw_stats
+        base_stats = {k: int(v) for k, v in raw_base.items()}
+        flags = {k: bool(v) for k, v in (s.get("flags") or {}).items()}
 
         mods_raw = list(s.get("modifiers") or [])
         modifiers: list[Modifier] = []
@@ -450,7 +552,7 @@ class App(tk.Tk):
             stats=stats,
             base_stats=base_stats,
             inventory=list(s.get("inventory") or []),
-            flags=dict(s.get("flags") or {}),
+            flags=flags,
             modifiers=modifiers,
         )
         self.state.history = list(s.get("history") or [])
@@ -484,19 +586,20 @@ class App(tk.Tk):
         if not profiles:
             return
 
-        default_pid = getattr(cc, "default_profile", None)
-        default_index = 0
-        if default_pid:
-            for i, p in enumerate(profiles):
-                if p.profile_id == default_pid:
-                    default_index = i
-                    break
+        # Reuse the (withdrawn) dialog from the previous run when it was built for the same
+        # ruleset; only a new book forces a rebuild of the widget tree.
+        top = self._reroll_top
+        if top is None or not top.winfo_exists() or self._reroll_widgets.get("cc") is not cc:
+            if top is not None and top.winfo_exists():
+                top.destroy()
+            top = self._build_character_creation_dialog(cc, profiles)
+        else:
+            self._reset_character_creation_dialog()
 
-        top = tk.Toplevel(self)
-        top.title("Character Creation")
-        top.geometry("820x520")
-        top.minsize(720, 460)
+        w = self._reroll_widgets
+        w["closed"].set(False)
 
+        top.deiconify()
         top.transient(self)
         top.grab_set()
         top.lift()
@@ -504,6 +607,60 @@ class App(tk.Tk):
         top.after(150, lambda: top.attributes("-topmost", False))
         top.focus_force()
 
+        self.wait_variable(w["closed"])
+
+    def _reset_character_creation_dialog(self) -> None:
+        w = self._reroll_widgets
+        session = w["session"]
+        session["roll"] += 1  # a roll still animating from the previous run must not finish into this one
+        session["profile"] = None
+        session["values"] = {}
+
+        default_pid = w["default_pid"]
+        if w["sel_profile"].get() != default_pid:
+            # trace rebuilds the rows and disables Start
+            w["sel_profile"].set(default_pid)
+        else:
+            for v in w["value_vars"].values():
+                v.set("—")
+            w["start_btn"].config(state="disabled")
+
+        log: tk.Text = w["log"]
+        log.configure(state="normal")
+        log.delete("1.0", "end")
+        log.insert("end", "Choose a profile, then click Roll.\n")
+        log.configure(state="disabled")
+
+    @staticmethod
+    def _on_roll_done(
+        total: int,
+        *,
+        sid: str,
+        off: int,
+        rolled_values: dict[str, int],
+        pending: dict[str, int],
+        finish_if_done,
+    ) -> None:
+        rolled_values[sid] = int(total) + int(off)
+        pending["n"] -= 1
+        finish_if_done()
+
+    def _build_character_creation_dialog(self, cc, profiles: list[CharacterProfile]) -> tk.Toplevel:
+        # Index profiles once: radiobutton callbacks / roll / start look them up by id
+        pid_to_profile: dict[str, CharacterProfile] = {p.profile_id: p for p in profiles}
+        id_list = [p.profile_id for p in profiles]
+
+        default_pid = getattr(cc, "default_profile", None)
+        default_index = id_list.index(default_pid) if default_pid in pid_to_profile else 0
+
+        top = tk.Toplevel(self)
+        top.withdraw()  # shown by _maybe_run_character_creation
+        top.title("Character Creation")
+        top.geometry("820x520")
+        top.minsize(720, 460)
+
+        closed = tk.BooleanVar(master=top, value=False)
+
         root = ttk.Frame(top)
         root.pack(fill="both", expand=True, padx=12, pady=12)
         root.columnconfigure(0, weight=1)
@@ -514,7 +671,7 @@ class App(tk.Tk):
         left.grid(row=0, column=0, sticky="nsew", padx=(0, 8), pady=(0, 8))
         left.columnconfigure(0, weight=1)
 
-        sel_profile = tk.StringVar(value=profiles[default_index].profile_id)
+        sel_profile = tk.StringVar(master=top, value=profiles[default_index].profile_id)
 
         for p in profiles:
             ttk.Radiobutton(
@@ -564,11 +721,9 @@ class App(tk.Tk):
             dice_widgets.clear()
             value_vars.clear()
 
-            keys = list(profile.stat_rolls.keys())
-            preferred = ["skill", "stamina", "luck"]
-            ordered: list[str] = [k for k in preferred if k in profile.stat_rolls] + [
-                k for k in keys if k not in preferred
-            ]
+            sr = profile.stat_rolls
+            ordered: list[str] = [k for k in _PREFERRED_STATS if k in sr]
+            ordered.extend(k for k in sr if k not in _PREFERRED_STATS_SET)
 
             if not ordered:
                 ttk.Label(rows_frame, text="(No rolls defined for this profile)").grid(row=0, column=0, sticky="w")
@@ -589,11 +744,7 @@ class App(tk.Tk):
                 ttk.Label(rows_frame, textvariable=v, width=8).grid(row=r, column=3, sticky="e", pady=6)
 
         def get_selected_profile() -> CharacterProfile:
-            pid = sel_profile.get()
-            for p in profiles:
-                if p.profile_id == pid:
-                    return p
-            return profiles[default_index]
+            return pid_to_profile.get(sel_profile.get(), profiles[default_index])
 
         build_rows_for_profile(get_selected_profile())
 
@@ -603,33 +754,40 @@ class App(tk.Tk):
 
         sel_profile.trace_add("write", on_profile_changed)
 
-        rolled_values: dict[str, int] = {}
-        rolled_profile: CharacterProfile | None = None
+        # Per-run roll results (reset by _reset_character_creation_dialog).
+        # "roll" is bumped by each Roll / close / reset; dice callbacks of an older roll are ignored.
+        session: dict = {"profile": None, "values": {}, "roll": 0}
 
         def do_roll():
-            nonlocal rolled_profile, rolled_values
+            session["roll"] += 1
+            roll_token = session["roll"]
             rolled_profile = get_selected_profile()
-            rolled_values = {}
+            rolled_values: dict[str, int] = {}
+            session["profile"] = rolled_profile
+            session["values"] = rolled_values
             start_btn.config(state="disabled")
 
             if not rolled_profile.stat_rolls:
                 messagebox.showerror("Roll error", "This profile has no roll definitions.")
                 return
 
-            specs: dict[str, tuple[int, int, int]] = {}
-            for stat_id, expr in rolled_profile.stat_rolls.items():
+            # Parsed once at book load (see _preparse_stat_rolls)
+            specs = self._stat_roll_specs.get(rolled_profile.profile_id)
+            if specs is None:
                 try:
-                    specs[stat_id] = parse_roll_expression(expr)
-                except Exception as e:
-                    messagebox.showerror("Roll error", f"{stat_id}: {e}")
+                    specs = self._stat_roll_specs[rolled_profile.profile_id] = _parse_profile_rolls(rolled_profile)
+                except ValueError as e:
+                    messagebox.showerror("Roll error", str(e))
                     return
 
-            play_wav(SFX_ROLL)
+            play_wav_async(SFX_ROLL)
             log_append(f"Rolling for profile: {rolled_profile.label or rolled_profile.profile_id}")
 
             pending = {"n": 0}
 
             def finish_if_done():
+                if session["roll"] != roll_token:
+                    return
                 if pending["n"] <= 0:
                     for sid, val in rolled_values.items():
                         if sid in value_vars:
@@ -646,16 +804,17 @@ class App(tk.Tk):
 
                 if n == 2 and sides == 6:
                     pending["n"] += 1
-
-                    def on_done_factory(sid: str, off: int):
-                        def _done(total_2d6: int):
-                            rolled_values[sid] = int(total_2d6) + int(off)
-                            pending["n"] -= 1
-                            finish_if_done()
-
-                        return _done
-
-                    dice_widgets[stat_id].animate_and_lock(self.rng, on_done=on_done_factory(stat_id, offset))
+                    dice_widgets[stat_id].animate_and_lock(
+                        self.rng,
+                        on_done=functools.partial(
+                            self._on_roll_done,
+                            sid=stat_id,
+                            off=offset,
+                            rolled_values=rolled_values,
+                            pending=pending,
+                            finish_if_done=finish_if_done,
+                        ),
+                    )
                     log_append(f"  {stat_id.upper()}: {expr}")
 
                 elif n == 1 and sides == 6:
@@ -683,10 +842,18 @@ class App(tk.Tk):
             if pending["n"] == 0:
                 finish_if_done()
 
+        def close():
+            # Keep the widget tree around for the next re-roll
+            session["roll"] += 1
+            top.grab_release()
+            top.withdraw()
+            closed.set(True)
+
         def apply_and_close():
-            nonlocal rolled_profile, rolled_values
+            rolled_profile: CharacterProfile | None = session["profile"]
+            rolled_values: dict[str, int] = session["values"]
             if not self.state:
-                top.destroy()
+                close()
                 return
             if not rolled_profile or not rolled_values:
                 messagebox.showinfo("Roll first", "Click Roll first.")
@@ -698,6 +865,7 @@ class App(tk.Tk):
                 self.state.base_stats[sid] = int(val)
 
             # Apply profile effects (CURRENT only)
+            stats_map = self.state.stats
             for eff in rolled_profile.effects:
                 if eff.add_item:
                     self.state.inventory.append(eff.add_item)
@@ -712,20 +880,34 @@ class App(tk.Tk):
                 if eff.clear_flag:
                     self.state.flags[eff.clear_flag] = False
                 if eff.modify_stat:
+                    # stats are ints already (normalized on load / creation)
                     for k, delta in eff.modify_stat.items():
-                        self.state.stats[k] = int(self.state.stats.get(k, 0)) + int(delta)
+                        stats_map[k] = stats_map.get(k, 0) + delta
 
             self._clamp_core()
             self._sync_stats_to_ui()
             self._sync_inventory_to_ui()
-            top.destroy()
+            close()
 
-        top.protocol("WM_DELETE_WINDOW", lambda: top.destroy())
+        top.protocol("WM_DELETE_WINDOW", close)
+        # Never leave wait_variable() hanging if the dialog is torn down from elsewhere
+        top.bind("<Destroy>", lambda e: closed.set(True) if e.widget is top else None)
 
         roll_btn.config(command=do_roll)
         start_btn.config(command=apply_and_close)
 
-        self.wait_window(top)
+        self._reroll_top = top
+        self._reroll_widgets = {
+            "cc": cc,
+            "closed": closed,
+            "session": session,
+            "default_pid": profiles[default_index].profile_id,
+            "sel_profile": sel_profile,
+            "value_vars": value_vars,
+            "start_btn": start_btn,
+            "log": log,
+        }
+        return top
 
     # ---------- Navigation helpers ----------
 
@@ -853,7 +1035,11 @@ class App(tk.Tk):
 
         self.text_box.configure(state="normal")
         self.text_box.delete("1.0", "end")
-        self.text_box.insert("1.0", f"[{para.pid}]\n\n{para.text}")
+        rendered = self._rendered_text_cache.get(para.pid)
+        if rendered is None:
+            rendered = f"[{para.pid}]\n\n{para.text}"
+            self._rendered_text_cache[para.pid] = rendered
+        self.text_box.insert("1.0", rendered)
 
         # NEW: show active effects (optional but useful)
         mods = getattr(self.state, "modifiers", []) or []
@@ -927,13 +1113,13 @@ class App(tk.Tk):
 
     # ---------- Combat ----------
 
-    def _run_combat(self, spec: CombatSpec) -> bool:
-        if not self.state or not self.book:
-            return False
-
-        session = CombatSession(self.state, spec, self.rng, ruleset=self.book.ruleset)
-
+    def _build_combat_dialog(self) -> dict:
+        """
+        Build the combat window once; later fights reuse it (withdrawn in between).
+        Per-fight wiring (commands, texts, states) is done by _run_combat.
+        """
         top = tk.Toplevel(self)
+        top.withdraw()
         top.title("Combat")
         top.geometry("900x660")
         top.minsize(700, 520)
@@ -949,11 +1135,7 @@ class App(tk.Tk):
         options_row.columnconfigure(0, weight=1)
         options_row.columnconfigure(1, weight=1)
 
-        use_luck_var = tk.BooleanVar(value=False)
-
-        luck_supported = getattr(session.profile, "luck", None) is not None
-        flee_supported = getattr(session.profile, "flee", None) is not None
-        flee_allowed = bool(getattr(spec, "allow_flee", False))
+        use_luck_var = tk.BooleanVar(master=top, value=False)
 
         luck_cb = ttk.Checkbutton(
             options_row,
@@ -961,13 +1143,9 @@ class App(tk.Tk):
             variable=use_luck_var,
         )
         luck_cb.grid(row=0, column=0, sticky="w")
-        if not luck_supported:
-            luck_cb.state(["disabled"])
 
         flee_btn = ttk.Button(options_row, text="Flee", state="disabled")
         flee_btn.grid(row=0, column=1, sticky="e")
-        if flee_supported and flee_allowed:
-            flee_btn.config(state="normal")
 
         # --- Dice row ---
         dice_row = ttk.Frame(root)
@@ -976,7 +1154,7 @@ class App(tk.Tk):
         dice_row.columnconfigure(1, weight=1)
 
         player_box = ttk.LabelFrame(dice_row, text="You (2d6)")
-        enemy_box = ttk.LabelFrame(dice_row, text=f"{spec.enemy_name} (2d6)")
+        enemy_box = ttk.LabelFrame(dice_row, text="")
         player_box.grid(row=0, column=0, sticky="ew", padx=(0, 8))
         enemy_box.grid(row=0, column=1, sticky="ew")
 
@@ -998,9 +1176,6 @@ class App(tk.Tk):
         ybar.grid(row=0, column=1, sticky="ns")
         txt.configure(yscrollcommand=ybar.set)
 
-        txt.insert("end", "\n".join(session.start_log()) + "\n")
-        txt.see("end")
-
         # --- Buttons ---
         btn_bar = ttk.Frame(root)
         btn_bar.grid(row=3, column=0, sticky="ew", padx=10, pady=(0, 10))
@@ -1012,8 +1187,68 @@ class App(tk.Tk):
         continue_btn = ttk.Button(btn_bar, text="Continue", state="disabled")
         continue_btn.grid(row=0, column=1, sticky="e")
 
+        return {
+            "top": top,
+            "use_luck_var": use_luck_var,
+            "luck_cb": luck_cb,
+            "flee_btn": flee_btn,
+            "enemy_box": enemy_box,
+            "dice_player": dice_player,
+            "dice_enemy": dice_enemy,
+            "txt": txt,
+            "roll_btn": roll_btn,
+            "continue_btn": continue_btn,
+        }
+
+    def _run_combat(self, spec: CombatSpec) -> bool:
+        if not self.state or not self.book:
+            return False
+
+        session = CombatSession(self.state, spec, self.rng, ruleset=self.book.ruleset)
+
+        w = self._combat_widgets
+        if w is None or not w["top"].winfo_exists():
+            w = self._combat_widgets = self._build_combat_dialog()
+        elif w.get("fight") is not None:
+            # The player navigated away (menu) with a fight still open: that fight is
+            # abandoned (no outcome goto) before its window is reset for this one.
+            w["fight"] = None
+            w["top"].withdraw()
+
+        top: tk.Toplevel = w["top"]
+        use_luck_var: tk.BooleanVar = w["use_luck_var"]
+        luck_cb: ttk.Checkbutton = w["luck_cb"]
+        flee_btn: ttk.Button = w["flee_btn"]
+        dice_player: DiceRoller = w["dice_player"]
+        dice_enemy: DiceRoller = w["dice_enemy"]
+        txt: tk.Text = w["txt"]
+        roll_btn: ttk.Button = w["roll_btn"]
+        continue_btn: ttk.Button = w["continue_btn"]
+
+        # --- Reset for this fight ---
+        use_luck_var.set(False)
+
+        luck_supported = getattr(session.profile, "luck", None) is not None
+        flee_supported = getattr(session.profile, "flee", None) is not None
+        flee_allowed = bool(getattr(spec, "allow_flee", False))
+
+        luck_cb.state(["!disabled"] if luck_supported else ["disabled"])
+        flee_btn.config(state="normal" if (flee_supported and flee_allowed) else "disabled")
+        w["enemy_box"].config(text=f"{spec.enemy_name} (2d6)")
+
+        roll_btn.config(state="normal")
+        continue_btn.config(state="disabled")
+
+        txt.delete("1.0", "end")
+        _append_log(txt, session.start_log())
+
+        # Dice callbacks of a closed fight must not touch the reused window:
+        # cleared when the fight ends, replaced when the next one starts
+        fight = w["fight"] = object()
+
         def _close_as_lose():
-            top.destroy()
+            w["fight"] = None
+            top.withdraw()
             self._sync_stats_to_ui()
             self._goto(spec.on_lose_goto, push_history=True)
 
@@ -1024,24 +1259,25 @@ class App(tk.Tk):
                 return
 
             _sfx_warn_if_missing(txt)
-            play_wav(SFX_ROLL)
+            play_wav_async(SFX_ROLL)
             roll_btn.config(state="disabled")
 
             results: dict[str, int] = {"p": 0, "e": 0}
 
             def maybe_continue():
+                if w.get("fight") is not fight:
+                    return
                 if results["p"] and results["e"]:
                     logs = session.roll_round(use_luck=bool(use_luck_var.get()))
                     if logs:
-                        txt.insert("end", "\n".join(logs) + "\n")
-                        txt.see("end")
+                        _append_log(txt, logs)
 
                     info = session.last_round()
                     if info:
                         if info.damage_to_enemy == 0 and info.damage_to_player == 0:
-                            play_wav(SFX_TIE)
+                            play_wav_async(SFX_TIE)
                         else:
-                            play_wav(SFX_HIT)
+                            play_wav_async(SFX_HIT)
 
                     self._clamp_core()
                     self._sync_stats_to_ui()
@@ -1067,12 +1303,11 @@ class App(tk.Tk):
             if session.finished:
                 return
             _sfx_warn_if_missing(txt)
-            play_wav(SFX_ROLL)
+            play_wav_async(SFX_ROLL)
 
             logs = session.flee(use_luck=bool(use_luck_var.get()))
             if logs:
-                txt.insert("end", "\n".join(logs) + "\n")
-                txt.see("end")
+                _append_log(txt, logs)
 
             self._clamp_core()
             self._sync_stats_to_ui()
@@ -1084,13 +1319,17 @@ class App(tk.Tk):
         roll_btn.config(command=roll_round)
 
         def finish():
-            top.destroy()
+            w["fight"] = None
+            top.withdraw()
             next_pid = spec.on_win_goto if session.won else spec.on_lose_goto
             self._sync_stats_to_ui()
             self._goto(next_pid, push_history=True)
 
         continue_btn.config(command=finish)
 
+        top.deiconify()
+        top.lift()
+
         return True
 
     # ---------- Test (ruleset-driven) ----------
@@ -1099,8 +1338,13 @@ class App(tk.Tk):
         if not self.state or not self.book:
             return False
 
+        # Spec fields hoisted once for the roll callbacks (state/rng stay live: Restart/Load may replace them)
+        _test_ref = getattr(spec, "test_ref", None)
+        _consume_s = spec.consume_on_success
+        _consume_f = spec.consume_on_fail
+
         ruleset = self.book.ruleset
-        rule = resolve_test_rule(ruleset, getattr(spec, "test_ref", None))
+        rule = resolve_test_rule(ruleset, _test_ref)
 
         # Dice/stat come from rule first, fallback to spec (strict books will usually be rule-driven)
         dice_expr = (rule.dice if rule and rule.dice else (spec.dice or "2d6")).strip()
@@ -1174,25 +1418,26 @@ class App(tk.Tk):
         top.protocol("WM_DELETE_WINDOW", _close_as_fail)
 
         stat_val = _effective_stat(stat_id)
-        txt.insert("end", f"Testing {stat_id.upper()} ({stat_val})\n")
-        txt.insert("end", f"Roll: {dice_expr}\n\n")
-        txt.insert("end", "Click 'Roll' to throw the dice.\n\n")
-        txt.see("end")
+        _append_log(
+            txt,
+            [
+                f"Testing {stat_id.upper()} ({stat_val})",
+                f"Roll: {dice_expr}\n",
+                "Click 'Roll' to throw the dice.\n",
+            ],
+        )
 
         def _apply_outcome(outcome) -> None:
             result["done"] = True
             result["success"] = bool(outcome.success)
 
-            txt.insert("end", f"You rolled {outcome.roll_total} against {outcome.stat_before} -> ")
-            txt.insert("end", "SUCCESS\n" if outcome.success else "FAILURE\n")
-
+            lines = [
+                f"You rolled {outcome.roll_total} against {outcome.stat_before} -> "
+                + ("SUCCESS" if outcome.success else "FAILURE")
+            ]
             if outcome.consumed:
-                txt.insert(
-                    "end",
-                    f"{outcome.stat_id.upper()} decreases by {outcome.consumed}. Now: {outcome.stat_after}\n"
-                )
-
-            txt.see("end")
+                lines.append(f"{outcome.stat_id.upper()} decreases by {outcome.consumed}. Now: {outcome.stat_after}")
+            _append_log(txt, lines)
             self._clamp_core()
             self._sync_stats_to_ui()
             continue_btn.config(state="normal")
@@ -1202,7 +1447,7 @@ class App(tk.Tk):
                 return
 
             _sfx_warn_if_missing(txt)
-            play_wav(SFX_ROLL)
+            play_wav_async(SFX_ROLL)
             roll_btn.config(state="disabled")
 
             # 2d6 -> animate, then apply pre-rolled total (NO double-roll)
@@ -1212,11 +1457,11 @@ class App(tk.Tk):
                     outcome = run_test_with_roll(
                         self.state,
                         ruleset=ruleset,
-                        test_ref=getattr(spec, "test_ref", None),
+                        test_ref=_test_ref,
                         stat_id=stat_id,
                         success_if="roll<=stat",
-                        consume_on_success=spec.consume_on_success,
-                        consume_on_fail=spec.consume_on_fail,
+                        consume_on_success=_consume_s,
+                        consume_on_fail=_consume_f,
                         roll_total=int(total),
                         roll_detail=(),
                     )
@@ -1230,11 +1475,11 @@ class App(tk.Tk):
             outcome = run_test_with_roll(
                 self.state,
                 ruleset=ruleset,
-                test_ref=getattr(spec, "test_ref", None),
+                test_ref=_test_ref,
                 stat_id=stat_id,
                 success_if="roll<=stat",
-                consume_on_success=spec.consume_on_success,
-                consume_on_fail=spec.consume_on_fail,
+                consume_on_success=_consume_s,
+                consume_on_fail=_consume_f,
                 roll_total=int(total),
                 roll_detail=tuple(int(x) for x in detail),
             )
@@ -1259,17 +1504,38 @@ class App(tk.Tk):
     def _sync_inventory_to_ui(self) -> None:
         if not self.state:
             return
-        self.inv_list.delete(0, "end")
-        for line in self.state.inventory:
-            self.inv_list.insert("end", line)
+        new = self.state.inventory
+        shown = self._inv_shown
+        if new == shown:
+            return
+
+        # Keep the common prefix (selection/scroll survive appends), rewrite the tail
+        p = 0
+        limit = min(len(new), len(shown))
+        while p < limit and new[p] == shown[p]:
+            p += 1
+        if p < len(shown):
+            self.inv_list.delete(p, "end")
+        if p < len(new):
+            self.inv_list.insert("end", *new[p:])
+        self._inv_shown = list(new)
 
     def _sync_stats_to_ui(self) -> None:
         if not self.state:
             return
+        stats = self.state.stats
+        base_stats = self.state.base_stats
+        last_base = self._last_base_shown
         for k, var in self.stats_vars.items():
-            var.set(str(int(self.state.stats.get(k, 0))))
-            base = int(self.state.base_stats.get(k, self.state.stats.get(k, 0)))
-            self.stats_base_vars[k].set(f"/ {base}" if base else "")
+            s = str(int(stats.get(k, 0)))
+            # Entries are user-editable: compare with what is displayed right now
+            if var.get() != s:
+                var.set(s)
+            base = int(base_stats.get(k, stats.get(k, 0)))
+            b = f"/ {base}" if base else ""
+            if last_base.get(k) != b:
+                self.stats_base_vars[k].set(b)
+                last_base[k] = b
 
 
 def run_app() -> None:
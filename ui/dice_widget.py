@@ -4,11 +4,17 @@ import tkinter as tk
 from tkinter import ttk
 from typing import List
 
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except Exception:
-    PIL_AVAILABLE = False
+# Shared lazy Pillow loader: imported when the first DiceRoller loads its faces
+from ui.image_viewer import _pil
+
+
+# (dice_dir, size_px) -> (owning Tk interpreter, {face: PhotoImage})
+# Faces are decoded/resized once per process and shared by every DiceRoller.
+_FACE_CACHE: dict = {}
+
+# Intermediate animation faces are cosmetic: draw them from a private RNG so the
+# game's rng sequence (final faces) does not depend on animation length.
+_FRAME_RNG = random.Random()
 
 
 class DiceRoller(ttk.Frame):
@@ -25,6 +31,13 @@ class DiceRoller(ttk.Frame):
         self.size_px = size_px
         self._photos = {}
 
+        # Current animation (frames, final faces, callback); the generation
+        # counter lets a new roll supersede timers still queued by an older one.
+        self._anim_gen = 0
+        self._anim_state = None
+        # ids of the queued after() ticks, cancelled on a new roll or destroy
+        self._anim_after: List[str] = []
+
         self.die1 = ttk.Label(self)
         self.die2 = ttk.Label(self)
         self.total_lbl = ttk.Label(self, font=("Segoe UI", 12, "bold"))
@@ -36,20 +49,33 @@ class DiceRoller(ttk.Frame):
         self._load_images()
 
     def _load_images(self):
-        if not PIL_AVAILABLE:
+        pil = _pil()
+        if pil is None:
             self.die1.configure(text="d6")
             self.die2.configure(text="d6")
             return
+        Image, ImageTk = pil
 
+        key = (self.dice_dir, self.size_px)
+        cached = _FACE_CACHE.get(key)
+        # PhotoImages belong to one Tk interpreter: rebuild if the root was recreated
+        if cached is not None and cached[0] is self.tk:
+            self._photos = cached[1]
+            return
+
+        photos = {}
         for face in range(1, 7):
             path = os.path.join(self.dice_dir, f"{face}.png")
             if os.path.exists(path):
                 img = Image.open(path)
-                img = img.resize((self.size_px, self.size_px))
-                self._photos[face] = ImageTk.PhotoImage(img)
+                # reducing_gap: cheap integer box-reduce first, LANCZOS only on the last step
+                img = img.resize((self.size_px, self.size_px), Image.LANCZOS, reducing_gap=2.0)
+                photos[face] = ImageTk.PhotoImage(img, master=self)
+        _FACE_CACHE[key] = (self.tk, photos)
+        self._photos = photos
 
     def _set_die_face(self, label: ttk.Label, face: int):
-        if PIL_AVAILABLE and face in self._photos:
+        if face in self._photos:
             label.configure(image=self._photos[face], text="")
         else:
             label.configure(text=str(face))
@@ -95,20 +121,56 @@ class DiceRoller(ttk.Frame):
         sides = max(2, int(sides))
 
         steps = max(1, duration_ms // max(1, tick_ms))
-        state = {"i": 0}
 
         final_faces = [rng.randint(1, sides) for _ in range(num_dice)]
         final_total = sum(final_faces)
 
-        def tick():
-            if state["i"] < steps:
-                faces = [rng.randint(1, sides) for _ in range(num_dice)]
-                self._set_faces(faces, num_dice=num_dice)
-                state["i"] += 1
-                self.after(tick_ms, tick)
-            else:
-                self._set_faces(final_faces, num_dice=num_dice)
-                if on_done:
-                    on_done(final_total)
-
-        tick()
\ No newline at end of file
+        # All intermediate frames are drawn up front in one bulk call; ticks only swap images
+        flat = _FRAME_RNG.choices(range(1, sides + 1), k=steps * num_dice)
+        frames = [flat[i:i + num_dice] for i in range(0, len(flat), num_dice)]
+
+        self._cancel_anim_timers()
+        self._anim_gen += 1
+        gen = self._anim_gen
+        self._anim_state = {
+            "frames": frames,
+            "final_faces": final_faces,
+            "final_total": final_total,
+            "num_dice": num_dice,
+            "on_done": on_done,
+        }
+
+        # Queue every tick at once instead of re-arming a timer from each tick
+        self._apply_precomputed_frame(gen, 0)
+        for i in range(1, steps):
+            self._anim_after.append(self.after(i * tick_ms, lambda i=i: self._apply_precomputed_frame(gen, i)))
+        self._anim_after.append(self.after(steps * tick_ms, lambda: self._finalize_frame(gen)))
+
+    def _cancel_anim_timers(self):
+        for after_id in self._anim_after:
+            try:
+                self.after_cancel(after_id)
+            except tk.TclError:
+                pass
+        self._anim_after = []
+
+    def destroy(self):
+        # queued ticks are Tcl commands owned by this widget: drop them before it goes away
+        self._cancel_anim_timers()
+        super().destroy()
+
+    def _apply_precomputed_frame(self, gen: int, i: int):
+        if gen != self._anim_gen:
+            return
+        st = self._anim_state
+        self._set_faces(st["frames"][i], num_dice=st["num_dice"])
+
+    def _finalize_frame(self, gen: int):
+        if gen != self._anim_gen:
+            return
+        st = self._anim_state
+        self._anim_state = None
+        self._anim_after = []
+        self._set_faces(st["final_faces"], num_dice=st["num_dice"])
+        if st["on_done"]:
+            st["on_done"](st["final_total"])
\ No newline at end of file
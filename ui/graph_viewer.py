@@ -2,16 +2,23 @@
 from __future__ import annotations
 
 import argparse
+import gzip
+import hashlib
+import importlib.util
 import os
 import platform
+import re
+import shutil
+import signal
 import subprocess
 import sys
 import threading
 import webbrowser
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from socket import socket
-from typing import Optional
+from typing import Callable, Optional
 
 
 def _repo_root() -> str:
@@ -32,32 +39,201 @@ def _ui_viewer_html_path() -> str:
 
 
 def _free_port() -> int:
-    s = socket()
-    s.bind(("127.0.0.1", 0))
-    port = int(s.getsockname()[1])
-    s.close()
-    return port
+    with socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
 
 
-class _ViewerServer(HTTPServer):
-    def __init__(self, server_address, RequestHandlerClass, *, out_dir: str, viewer_html: str, py_exe: str, tool_py: str, xml_path: str):
+# Graphviz SVG post-processing (smaller file -> faster transfer and parse)
+_SVG_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+_SVG_GEOM_ATTR_RE = re.compile(r'(\s(?:d|points|x|y|x1|y1|x2|y2|cx|cy|rx|ry|transform|viewBox)=")([^"]*)(")')
+_SVG_LONG_DECIMAL_RE = re.compile(r"-?\d+\.\d{3,}")
+_SVG_INTER_TAG_WS_RE = re.compile(r">\s+<")
+
+
+def _round_geom_attr(m: re.Match) -> str:
+    value = _SVG_LONG_DECIMAL_RE.sub(lambda n: f"{float(n.group()):.2f}", m.group(2))
+    return m.group(1) + value + m.group(3)
+
+
+def _minify_svg(svg_path: str) -> None:
+    """
+    Shrink a Graphviz SVG in place: geometry numbers rounded to 2 decimals,
+    comments and whitespace between tags removed. Text content is untouched.
+    Written via a temp file + os.replace so a concurrent GET never sees half a file.
+    """
+    txt = Path(svg_path).read_text(encoding="utf-8")
+    txt = _SVG_COMMENT_RE.sub("", txt)
+    txt = _SVG_GEOM_ATTR_RE.sub(_round_geom_attr, txt)
+    txt = _SVG_INTER_TAG_WS_RE.sub("><", txt)
+    tmp = svg_path + ".tmp"
+    Path(tmp).write_text(txt, encoding="utf-8")
+    os.replace(tmp, svg_path)
+
+
+def _load_export_fn(tool_py: str) -> Optional[Callable[[str, str, str], int]]:
+    """
+    Import author_tool.py once and return its CLI export entry point, so a refresh
+    does not pay for a new interpreter + imports. None -> use the subprocess path.
+    """
+    try:
+        root = _repo_root()
+        if root not in sys.path:
+            sys.path.insert(0, root)  # author_tool imports engine.* / ui.*
+        spec = importlib.util.spec_from_file_location("author_tool", tool_py)
+        if spec is None or spec.loader is None:
+            return None
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        return getattr(mod, "_cli_export_graph", None)
+    except Exception:
+        return None
+
+
+class _ViewerServer(ThreadingHTTPServer):
+    # one thread per request: a slow /api/refresh must not block graph.svg / viewer.html
+    daemon_threads = True
+
+    def __init__(
+        self,
+        server_address,
+        RequestHandlerClass,
+        *,
+        out_dir: str,
+        viewer_html: str,
+        py_exe: str,
+        tool_py: str,
+        xml_path: str,
+        export_fn: Optional[Callable[[str, str, str], int]] = None,
+    ):
         super().__init__(server_address, RequestHandlerClass)
         self.out_dir = out_dir
         self.viewer_html = viewer_html
+        # viewer.html is static for the server's lifetime: read it once
+        self.viewer_html_bytes = Path(viewer_html).read_bytes()
+        self.viewer_html_etag = f'"{hashlib.md5(self.viewer_html_bytes).hexdigest()}"'
         self.py_exe = py_exe
         self.tool_py = tool_py
         self.xml_path = xml_path
+        # None until the first refresh imports author_tool (see _export_graph)
+        self.export_fn = export_fn
+        self._export_fn_resolved = export_fn is not None
+        # Single export worker (never two writers on graph.svg); clicks that arrive while
+        # an export is running join it instead of queueing another one.
+        self._refresh_lock = threading.Lock()
+        self._refresh_inflight: Optional[Future] = None
+        self._refresh_executor = ThreadPoolExecutor(max_workers=1)
+        # (etag, gzip bytes) of the current graph.svg: compressed once per export, not per GET
+        self._svg_gz_lock = threading.Lock()
+        self._svg_gz: Optional[tuple[str, bytes]] = None
+
+    def _export_graph(self) -> None:
+        dot_out = str(Path(self.out_dir) / "graph.dot")
+        svg_out = str(Path(self.out_dir) / "graph.svg")
+        if not self._export_fn_resolved:
+            # First refresh, on the export worker: author_tool's imports stay off viewer startup
+            self.export_fn = _load_export_fn(self.tool_py)
+            self._export_fn_resolved = True
+        if self.export_fn is not None:
+            rc = self.export_fn(self.xml_path, dot_out, svg_out)
+            if rc:
+                raise RuntimeError(f"graph export failed (code {rc})")
+        else:
+            subprocess.run(
+                [self.py_exe, self.tool_py, "--export-graph", "--xml", self.xml_path, "--dot", dot_out, "--svg", svg_out],
+                check=True,
+                cwd=_repo_root(),
+            )
+        _minify_svg(svg_out)
+
+    def _svg_up_to_date(self) -> bool:
+        svg_out = os.path.join(self.out_dir, "graph.svg")
+        try:
+            return os.path.exists(svg_out) and os.path.getmtime(self.xml_path) <= os.path.getmtime(svg_out)
+        except OSError:
+            return False
+
+    def start_refresh(self) -> bool:
+        """
+        Start exporting graph.dot/graph.svg in the background and return immediately.
+        Nothing is exported when graph.svg is newer than the book XML.
+        Returns True when an export was already running (the call joins it).
+        """
+        with self._refresh_lock:
+            fut = self._refresh_inflight
+            coalesced = fut is not None and not fut.done()
+            if not coalesced:
+                if self._svg_up_to_date():
+                    fut = Future()
+                    fut.set_result(None)
+                    self._refresh_inflight = fut
+                else:
+                    self._refresh_inflight = self._refresh_executor.submit(self._export_graph)
+        return coalesced
+
+    def refresh_status(self) -> str:
+        """
+        State of the latest export: "idle", "running", "ok" or "ERROR: <message>".
+        """
+        fut = self._refresh_inflight
+        if fut is None:
+            return "idle"
+        if not fut.done():
+            return "running"
+        exc = fut.exception()
+        return "ok" if exc is None else f"ERROR: {exc}"
+
+    def gzipped_svg(self, svg_path: Path, etag: str) -> bytes:
+        with self._svg_gz_lock:
+            if self._svg_gz is None or self._svg_gz[0] != etag:
+                self._svg_gz = (etag, gzip.compress(svg_path.read_bytes(), compresslevel=6))
+            return self._svg_gz[1]
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._refresh_executor.shutdown(wait=False)
 
 
 class _Handler(BaseHTTPRequestHandler):
-    def _send_bytes(self, data: bytes, content_type: str, code: int = 200) -> None:
+    def _send_bytes(self, data: bytes, content_type: str, code: int = 200, *, extra_headers: Optional[dict] = None) -> None:
         self.send_response(code)
         self.send_header("Content-Type", content_type)
-        self.send_header("Cache-Control", "no-store")
+        headers = extra_headers or {"Cache-Control": "no-store"}
+        for k, v in headers.items():
+            self.send_header(k, v)
         self.send_header("Content-Length", str(len(data)))
         self.end_headers()
         self.wfile.write(data)
 
+    def _send_file(self, path: Path, content_type: str, *, extra_headers: Optional[dict] = None) -> None:
+        """
+        Stream a file in 64 KiB chunks instead of loading it whole (large SVGs).
+        Opened before the status line so an open error (OSError) reaches the caller,
+        which can still answer 500; a failure mid-stream just drops the connection.
+        """
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            headers = extra_headers or {"Cache-Control": "no-store"}
+            for k, v in headers.items():
+                self.send_header(k, v)
+            self.send_header("Content-Length", str(size))
+            self.end_headers()
+            try:
+                shutil.copyfileobj(f, self.wfile, 64 * 1024)
+            except OSError:
+                # headers are out: a 500 is no longer possible (and the client may be gone)
+                self.close_connection = True
+
+    def _send_not_modified_if_match(self, etag: str) -> bool:
+        if self.headers.get("If-None-Match") != etag:
+            return False
+        self.send_response(304)
+        self.send_header("ETag", etag)
+        self.end_headers()
+        return True
+
     def _send_text(self, text: str, content_type: str, code: int = 200) -> None:
         self._send_bytes(text.encode("utf-8"), content_type, code)
 
@@ -65,11 +241,13 @@ class _Handler(BaseHTTPRequestHandler):
         srv: _ViewerServer = self.server  # type: ignore
 
         if self.path in ("/", "/index.html"):
-            try:
-                html = Path(srv.viewer_html).read_text(encoding="utf-8")
-                self._send_text(html, "text/html; charset=utf-8")
-            except Exception as e:
-                self._send_text(f"viewer.html read error: {e}", "text/plain; charset=utf-8", 500)
+            if self._send_not_modified_if_match(srv.viewer_html_etag):
+                return
+            self._send_bytes(
+                srv.viewer_html_bytes,
+                "text/html; charset=utf-8",
+                extra_headers={"Cache-Control": "no-cache", "ETag": srv.viewer_html_etag},
+            )
             return
 
         if self.path.startswith("/graph.svg"):
@@ -77,7 +255,29 @@ class _Handler(BaseHTTPRequestHandler):
             if not svg_path.exists():
                 self._send_text("graph.svg not found (export first)", "text/plain; charset=utf-8", 404)
                 return
-            self._send_bytes(svg_path.read_bytes(), "image/svg+xml")
+            try:
+                # Weak validator from mtime+size: unchanged SVG -> 304, no disk read
+                st = svg_path.stat()
+                etag = f'W/"{int(st.st_mtime_ns):x}-{st.st_size:x}"'
+                if self._send_not_modified_if_match(etag):
+                    return
+                headers = {"Cache-Control": "public, max-age=0, must-revalidate", "ETag": etag, "Vary": "Accept-Encoding"}
+                # SVG text compresses ~5-10x; browsers/QtWebEngine decode Content-Encoding transparently
+                gz = None
+                if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+                    gz = srv.gzipped_svg(svg_path, etag)
+                else:
+                    self._send_file(svg_path, "image/svg+xml", extra_headers=headers)
+            except OSError as e:
+                self._send_text(f"graph.svg read error: {e}", "text/plain; charset=utf-8", 500)
+                return
+            if gz is not None:
+                headers["Content-Encoding"] = "gzip"
+                self._send_bytes(gz, "image/svg+xml", extra_headers=headers)
+            return
+
+        if self.path == "/api/refresh/status":
+            self._send_text(srv.refresh_status(), "text/plain; charset=utf-8")
             return
 
         # optional: serve local JS/CSS assets later (offline mode); for now, 404
@@ -87,15 +287,10 @@ class _Handler(BaseHTTPRequestHandler):
         srv: _ViewerServer = self.server  # type: ignore
 
         if self.path == "/api/refresh":
+            # non-blocking: the page polls /api/refresh/status and reloads graph.svg when done
             try:
-                dot_out = str(Path(srv.out_dir) / "graph.dot")
-                svg_out = str(Path(srv.out_dir) / "graph.svg")
-                subprocess.run(
-                    [srv.py_exe, srv.tool_py, "--export-graph", "--xml", srv.xml_path, "--dot", dot_out, "--svg", svg_out],
-                    check=True,
-                    cwd=_repo_root(),
-                )
-                self._send_text("OK", "text/plain; charset=utf-8", 200)
+                srv.start_refresh()
+                self._send_text(srv.refresh_status(), "text/plain; charset=utf-8", 202)
             except Exception as e:
                 self._send_text(f"ERROR: {e}", "text/plain; charset=utf-8", 500)
             return
@@ -111,6 +306,12 @@ def _start_server(py_exe: str, tool_py: str, xml_path: str, out_dir: str):
     if not os.path.exists(viewer_html):
         raise FileNotFoundError(f"viewer.html not found at {viewer_html}")
 
+    # the initial graph.svg was exported by author_tool before launching us
+    try:
+        _minify_svg(os.path.join(out_dir, "graph.svg"))
+    except Exception:
+        pass
+
     port = _free_port()
     srv = _ViewerServer(
         ("127.0.0.1", port),
@@ -171,9 +372,11 @@ def main(argv: Optional[list[str]] = None) -> int:
         if not _try_pywebview_open(url):
             webbrowser.open(url)
 
-        # Keep process alive
-        while True:
-            threading.Event().wait(3600)
+        # Keep process alive until SIGINT/SIGTERM
+        shutdown_event = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: shutdown_event.set())
+        signal.signal(signal.SIGINT, lambda *_: shutdown_event.set())
+        shutdown_event.wait()
 
     except KeyboardInterrupt:
         pass
@@ -181,6 +384,7 @@ def main(argv: Optional[list[str]] = None) -> int:
         if srv is not None:
             try:
                 srv.shutdown()
+                srv.server_close()
             except Exception:
                 pass
     return 0
@@ -4,9 +4,12 @@ from __future__ import annotations
 import os
 import sys
 import tkinter as tk
+from functools import lru_cache
 
 
 _ICON_PHOTO: tk.PhotoImage | None = None
+# Set once the icon file was found missing: later windows skip the probe (and the warning)
+_ICON_MISSING = False
 
 
 def _repo_root() -> str:
@@ -19,6 +22,7 @@ def _repo_root() -> str:
     return os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
 
+@lru_cache(maxsize=1)
 def _icon_path() -> str:
     """
     <racine>/ui/assets/Icons/lveh_256.png
@@ -36,16 +40,20 @@ def get_icon_path() -> str:
 
 
 def _load_icon(root: tk.Misc) -> tk.PhotoImage | None:
-    global _ICON_PHOTO
+    global _ICON_PHOTO, _ICON_MISSING
+
+    # Called for every Toplevel: after the first probe this is just a global lookup
+    if _ICON_PHOTO is not None or _ICON_MISSING:
+        return _ICON_PHOTO
 
     path = _icon_path()
 
     if not os.path.exists(path):
         print(f"[icon] Icon not found: {path}")
+        _ICON_MISSING = True
         return None
 
-    if _ICON_PHOTO is None:
-        _ICON_PHOTO = tk.PhotoImage(master=root, file=path)
+    _ICON_PHOTO = tk.PhotoImage(master=root, file=path)
 
     return _ICON_PHOTO
 
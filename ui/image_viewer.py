@@ -1,16 +1,40 @@
 from __future__ import annotations
 
+import importlib.util
 import os
 import sys
 import tkinter as tk
+from functools import lru_cache
 from tkinter import ttk
 
-try:
-    from PIL import Image, ImageTk
+# Pillow is only imported on first use (image preview, dice faces via ui.dice_widget);
+# probing for it is cheap.
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
+_PIL: dict = {}
 
-    PIL_AVAILABLE = True
-except Exception:
-    PIL_AVAILABLE = False
+
+def _pil():
+    """
+    Return (Image, ImageTk), importing Pillow on first call.
+    None if Pillow (or its Tk bridge) turns out not to be importable.
+    """
+    global PIL_AVAILABLE
+    if not _PIL and PIL_AVAILABLE:
+        try:
+            from PIL import Image, ImageTk
+        except Exception:
+            PIL_AVAILABLE = False
+        else:
+            _PIL["Image"] = Image
+            _PIL["ImageTk"] = ImageTk
+    if not _PIL:
+        return None
+    return _PIL["Image"], _PIL["ImageTk"]
+
+
+# Zoom levels up to this many pixels are kept (LRU) so wheel back-and-forth is a lookup;
+# larger renders are not cached to bound memory.
+_RESIZE_CACHE_MAX_PIXELS = 2048 * 2048
 
 
 class ImagePanel(ttk.Frame):
@@ -52,7 +76,8 @@ class ImagePanel(ttk.Frame):
 
         self._path = path
 
-        if not PIL_AVAILABLE:
+        pil = _pil()
+        if pil is None:
             self.label.configure(image="")
             try:
                 self.label.image = None
@@ -61,6 +86,8 @@ class ImagePanel(ttk.Frame):
             self.label.configure(text=f"(Image: {os.path.basename(path)} — install Pillow for preview)")
             return
 
+        Image, ImageTk = pil
+
         # Load + thumbnail
         img = Image.open(path)
         img.thumbnail(max_size)
@@ -78,10 +105,12 @@ class ImagePanel(ttk.Frame):
     def _on_click(self, _evt) -> None:
         if not self._path:
             return
-        if not PIL_AVAILABLE:
+        pil = _pil()
+        if pil is None:
             return
         if not os.path.exists(self._path):
             return
+        Image, ImageTk = pil
 
         top = tk.Toplevel(self)
         top.title("Image Viewer")
@@ -106,6 +135,7 @@ class ImagePanel(ttk.Frame):
 
         # --- State (per viewer window) ---
         pil_orig = Image.open(self._path)
+        pil_orig.load()  # decode once up front (and release the file), not lazily on the first resize
         pil_mode = pil_orig.mode
         if pil_mode not in ("RGB", "RGBA"):
             # avoid odd modes when resizing
@@ -118,14 +148,46 @@ class ImagePanel(ttk.Frame):
             "max_scale": 12.0,
             "img_id": None,
             "photo": None,
+            "half": None,  # lazily built half-size copy used as source for downscales
+            "interacting": False,  # wheel zoom in progress -> cheap BILINEAR renders
+            "idle_after": None,  # pending LANCZOS re-render once the wheel stops
+            "configure_after": None,  # pending refit once a window resize settles
+            "win_size": None,
         }
 
-        def _render_at_scale(scale: float, keep_point: tuple[float, float] | None = None, screen_xy: tuple[int, int] | None = None):
+        def _resize_source(size: tuple[int, int]):
+            # mipmap-style: targets at or below half size resample from a 2x-reduced copy
+            ow, oh = state["orig"].size
+            if size[0] * 2 <= ow and size[1] * 2 <= oh:
+                if state["half"] is None:
+                    state["half"] = state["orig"].reduce(2)
+                return state["half"]
+            return state["orig"]
+
+        def _resize_uncached(size: tuple[int, int], resample):
+            return _resize_source(size).resize(size, resample)
+
+        _resize_cached = lru_cache(maxsize=8)(_resize_uncached)
+
+        def _resize(size: tuple[int, int], resample):
+            if size[0] * size[1] > _RESIZE_CACHE_MAX_PIXELS:
+                return _resize_uncached(size, resample)
+            return _resize_cached(size, resample)
+
+        def _render_at_scale(
+            scale: float,
+            keep_point: tuple[float, float] | None = None,
+            screen_xy: tuple[int, int] | None = None,
+            resample=None,
+        ):
             """
             Render the image at given scale and keep the (canvas) point under the cursor stable.
             keep_point: (canvas_x, canvas_y) before redraw
             screen_xy: (event.x, event.y) within canvas widget
+            resample: PIL filter; default BILINEAR while zooming, LANCZOS otherwise
             """
+            if resample is None:
+                resample = Image.BILINEAR if state["interacting"] else Image.LANCZOS
             scale = max(state["min_scale"], min(state["max_scale"], float(scale)))
             state["scale"] = scale
 
@@ -134,14 +196,19 @@ class ImagePanel(ttk.Frame):
             nh = max(1, int(oh * scale))
 
             # Resize with Pillow
-            resized = state["orig"].resize((nw, nh), Image.LANCZOS)
-            photo = ImageTk.PhotoImage(resized)
-            state["photo"] = photo  # keep ref
-
-            if state["img_id"] is None:
-                state["img_id"] = canvas.create_image(0, 0, anchor="nw", image=photo)
+            resized = _resize((nw, nh), resample)
+            photo = state["photo"]
+            if photo is not None and (photo.width(), photo.height()) == (nw, nh):
+                # same size (e.g. LANCZOS refine of the last wheel step): upload into the existing Tk image
+                photo.paste(resized)
             else:
-                canvas.itemconfigure(state["img_id"], image=photo)
+                photo = ImageTk.PhotoImage(resized)
+                state["photo"] = photo  # keep ref
+
+                if state["img_id"] is None:
+                    state["img_id"] = canvas.create_image(0, 0, anchor="nw", image=photo)
+                else:
+                    canvas.itemconfigure(state["img_id"], image=photo)
 
             # Update scroll region
             canvas.configure(scrollregion=(0, 0, nw, nh))
@@ -191,6 +258,22 @@ class ImagePanel(ttk.Frame):
         _fit_to_window()
 
         # --- Bindings: zoom / pan / reset ---
+        def _final_render():
+            # wheel has been idle for a moment: redo the current zoom level in full quality
+            state["idle_after"] = None
+            state["interacting"] = False
+            _render_at_scale(state["scale"])
+
+        def _on_destroy(event):
+            if event.widget is not top:
+                return
+            for key in ("idle_after", "configure_after"):
+                if state[key] is not None:
+                    top.after_cancel(state[key])
+                    state[key] = None
+
+        top.bind("<Destroy>", _on_destroy, add="+")
+
         def _zoom_wheel(event):
             # Determine wheel direction and step
             if sys.platform.startswith("linux"):
@@ -202,6 +285,11 @@ class ImagePanel(ttk.Frame):
             # Zoom factor: smooth-ish
             factor = 1.1 if direction > 0 else 0.9
 
+            state["interacting"] = True
+            if state["idle_after"] is not None:
+                top.after_cancel(state["idle_after"])
+            state["idle_after"] = top.after(120, _final_render)
+
             # Keep point under mouse
             keep_cx = canvas.canvasx(event.x)
             keep_cy = canvas.canvasy(event.y)
@@ -245,13 +333,21 @@ class ImagePanel(ttk.Frame):
         top.bind("<KeyPress-f>", lambda _e: _fit_to_window())
         top.bind("<KeyPress-1>", _reset_view)
 
-        # If the window is resized, keep the image visible (do not constantly refit; just update scrollregion)
-        # Optional: refit once on first configure after open
-        _did_first_configure = {"done": False}
+        # If the window is resized, refit once the drag settles (Tk fires <Configure> per pixel)
+        def _refit_after_resize():
+            state["configure_after"] = None
+            _fit_to_window()
 
-        def _on_configure(_e):
-            if not _did_first_configure["done"]:
-                _did_first_configure["done"] = True
-                _fit_to_window()
+        def _on_configure(e):
+            # bound on the toplevel: ignore child widgets and pure moves
+            if e.widget is not top:
+                return
+            size = (e.width, e.height)
+            if size == state["win_size"]:
+                return
+            state["win_size"] = size
+            if state["configure_after"] is not None:
+                top.after_cancel(state["configure_after"])
+            state["configure_after"] = top.after(120, _refit_after_resize)
 
         top.bind("<Configure>", _on_configure)
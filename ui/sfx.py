@@ -1,8 +1,15 @@
 import os
+import threading
 
 # Lazy-loaded mixer state
 _mixer_initialized = False
 
+# Decoded pygame.mixer.Sound per WAV path (the engine only uses a handful of SFX files)
+_SOUND_CACHE: dict = {}
+
+# Serializes mixer init / Sound loading across background playback threads
+_SFX_LOCK = threading.Lock()
+
 
 def _init_mixer():
     global _mixer_initialized
@@ -34,9 +41,25 @@ def play_wav(wav_path: str):
         if not _mixer_initialized:
             return
 
-        sound = pygame.mixer.Sound(wav_path)
+        sound = _SOUND_CACHE.get(wav_path)
+        if sound is None:
+            sound = pygame.mixer.Sound(wav_path)
+            _SOUND_CACHE[wav_path] = sound
         sound.play()  # async by default
 
     except Exception:
         # Never crash the UI because of sound
-        pass
\ No newline at end of file
+        pass
+
+
+def _play_wav_locked(wav_path: str):
+    with _SFX_LOCK:
+        play_wav(wav_path)
+
+
+def play_wav_async(wav_path: str):
+    """
+    Same as play_wav(), but runs on a daemon thread so WAV loading / mixer init
+    never stalls the Tk event loop (e.g. right before a dice animation).
+    """
+    threading.Thread(target=_play_wav_locked, args=(wav_path,), daemon=True).start()